@@ -9,10 +9,20 @@ import time
 import json
 import re
 import os
-import pickle
+import math
+import random
+import signal
+import atexit
+import functools
+import itertools
+import multiprocessing
+import multiprocessing.util
+from collections import deque
+from dataclasses import dataclass, field, fields, is_dataclass
 from datetime import datetime
-import pandas as pd
+from html.parser import HTMLParser
 from urllib.parse import urljoin, urlparse
+import requests
 import gspread
 from google.oauth2 import service_account
 
@@ -22,10 +32,211 @@ from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
 
 
+# ChromeDriver binary used for local development
+LOCAL_CHROMEDRIVER = "./chromedriver"
+
+# Number of parallel browser workers used for Craigslist listing pages
+CRAIGSLIST_WORKERS = 4
+
+# Random pause range (seconds) before each listing page request, so parallel browsers
+# and concurrent tabs stay under Craigslist's rate limits
+CRAIGSLIST_REQUEST_DELAY = (0.5, 1.5)
+
+# Listing pages loaded concurrently in tabs when scraping with a single browser
+CRAIGSLIST_TAB_CONCURRENCY = 4
+
+# Plain HTTP settings for reading Craigslist search pages without a browser
+CRAIGSLIST_HTTP_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                  "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+CRAIGSLIST_HTTP_TIMEOUT = 15
+
+# Saved Facebook login cookies (plain JSON - never unpickle untrusted files)
+FB_SESSION_FILE = "facebook_session.json"
+
+# Above this many rows, sheets are uploaded as chunked RAW value arrays instead of JSON cell values
+CHUNKED_UPLOAD_MIN_ROWS = 5000
+UPLOAD_CHUNK_ROWS = 5000
+
+# Craigslist title ("2021 Ford F-150 XLT") and location cleanup patterns
+TITLE_RE = re.compile(r'(\d{4})\s+([A-Za-z]+)\s+([A-Za-z0-9\-\s]+)')
+PARENS_RE = re.compile(r'[()]')
+GMAP_RE = re.compile(r'google map.*$', re.IGNORECASE)
+
+# Craigslist page fields, each with candidate (selector, source) lookups tried in order.
+# source is 'text' for the element's text, 'href' for its resolved link, or '@name' for an attribute.
+CL_FIELDS = (
+    ('title', (('#titletextonly', 'text'), ('.postingtitletext .titletextonly', 'text'),
+               ('h1 .titletextonly', 'text'), ('.postingtitle', 'text'))),
+    ('price', (('.price', 'text'),)),
+    ('vin', (('.attr.auto_vin .valu', 'text'),)),
+    ('mileage', (('.attr.auto_miles .valu', 'text'),)),
+    ('cylinders', (('.attr.auto_cylinders .valu', 'text'),)),
+    ('drive', (('.attr.auto_drivetrain .valu', 'text'),)),
+    ('fuel', (('.attr.auto_fuel_type .valu', 'text'),)),
+    ('color', (('.attr.auto_paint .valu', 'text'),)),
+    ('transmission', (('.attr.auto_transmission .valu', 'text'),)),
+    ('type', (('.attr.auto_bodytype .valu', 'text'),)),
+    ('primary_location', (('.postingtitletext small', 'text'),)),
+    ('address', (('.mapaddress', 'text'),)),
+    ('google_maps_link', (('.mapaddress a', 'href'),)),
+    ('date_posted', (('time.date.timeago', '@datetime'), ('time.date.timeago', '@title'),
+                     ('time.date.timeago', 'text'), ('.postinginfos .postinginfo:first-child .date', 'text'))),
+)
+
+# Reads every CL_FIELDS entry (passed as arguments[0]) in a single browser round-trip
+CRAIGSLIST_DETAILS_JS = """
+const read = (selector, source) => {
+    const el = document.querySelector(selector);
+    if (!el) return '';
+    if (source === 'text') return el.innerText.trim();
+    if (source === 'href') return el.href || '';
+    return el.getAttribute(source.slice(1)) || '';
+};
+const result = {};
+for (const [name, lookups] of arguments[0]) {
+    result[name] = '';
+    for (const [selector, source] of lookups) {
+        result[name] = read(selector, source);
+        if (result[name]) break;
+    }
+}
+return result;
+"""
+
+# Search result containers tried in order, with the links to read inside each one
+CL_SEARCH_STRATEGIES = (
+    ('.result-node', 'a.cl-app-anchor', 'result nodes'),
+    ('.cl-search-result', 'a', 'cl-search-result elements'),
+    ('[data-pid]', 'a', 'elements with data-pid'),
+)
+
+# Returns, for each (container, link) selector pair in arguments[0], the link hrefs of every container
+CRAIGSLIST_SEARCH_JS = """
+return arguments[0].map(([container, link]) =>
+    Array.from(document.querySelectorAll(container),
+               node => Array.from(node.querySelectorAll(link), a => a.href || '')));
+"""
+
+# Returns the largest element count across the CSS selectors passed as arguments[0]
+FB_LISTING_COUNT_JS = """
+let maxCount = 0;
+for (const selector of arguments[0]) {
+    try {
+        maxCount = Math.max(maxCount, document.querySelectorAll(selector).length);
+    } catch (e) {}
+}
+return maxCount;
+"""
+
+# Returns href, image alt text and rendered text for every distinct link matching arguments[0],
+# so all Facebook listings are read in a single browser round-trip
+FB_LISTINGS_JS = """
+const seen = new Set();
+const listings = [];
+for (const link of document.querySelectorAll(arguments[0])) {
+    // Skip repeated links before paying for their innerText layout
+    if (!link.href || seen.has(link.href)) continue;
+    seen.add(link.href);
+    const img = link.querySelector('img');
+    listings.push({
+        href: link.href,
+        alt: img ? (img.getAttribute('alt') || '') : '',
+        text: link.innerText || ''
+    });
+}
+return listings;
+"""
+
+# Facebook price ("$12,500"), location ("Bend, OR") and mileage ("45K miles") patterns,
+# matched against the lines of a listing's text. Each one also enforces the line length limit.
+PRICE_RE = re.compile(r'^\$(?=.*\d).{1,28}$')
+LOCATION_RE = re.compile(r'^(?=.{1,49}$)[^,]+, (?:OR|WA|CA|ID|NV)\b')
+MILEAGE_RE = re.compile(r'^(?=.{1,49}$).*?\b\d[\d,.]*\s*[Kk]?\s*miles?\b', re.IGNORECASE)
+
+# Subresources blocked on Craigslist pages - only text and attributes are scraped
+BLOCKED_URL_PATTERNS = (
+    "*.png", "*.jpg", "*.jpeg", "*.webp", "*.gif", "*.mp4",
+    "*.woff*", "*.ttf", "*.css",
+    "*google-analytics*", "*googletagmanager*", "*doubleclick*"
+)
+
+
+@dataclass(slots=True)
+class Listing:
+    """A single Craigslist listing"""
+    url: str
+    title: str = ''
+    price: str = ''
+    year: str = ''
+    make: str = ''
+    model: str = ''
+    vin: str = ''
+    mileage: str = ''
+    cylinders: str = ''
+    drive: str = ''
+    fuel: str = ''
+    color: str = ''
+    transmission: str = ''
+    type: str = ''
+    location: str = ''
+    google_maps_link: str = ''
+    date_posted: str = ''
+    date_scraped: str = field(default_factory=lambda: datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+    source: str = 'Craigslist'
+
+
+LISTING_FIELD_NAMES = frozenset(listing_field.name for listing_field in fields(Listing))
+
+
+def _absolute_url(href, origin, page_url):
+    """Resolve href, only falling back to urljoin for relative paths like ./ or ../"""
+    if href.startswith(('http://', 'https://')):
+        return href
+    if href.startswith('/') and not href.startswith('//'):
+        return origin + href
+    return urljoin(page_url, href)
+
+
+def count_filled(records, names):
+    """Count how many listings have a real value for each field, in one pass over the listings"""
+    counts = dict.fromkeys(names, 0)
+    for record in records:
+        for name in names:
+            value = record[name] if isinstance(record, dict) else getattr(record, name)
+            if value and value != 'N/A':
+                counts[name] += 1
+    return counts
+
+
+class _LinkParser(HTMLParser):
+    """Collect the href of every <a> tag in an HTML document"""
+    
+    def __init__(self):
+        super().__init__()
+        self.hrefs = []
+    
+    def handle_starttag(self, tag, attrs):
+        if tag == 'a':
+            href = dict(attrs).get('href')
+            if href:
+                self.hrefs.append(href)
+
+
+def _cell_text(value):
+    """Convert a listing value to sheet text, showing missing values as 'N/A'"""
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return 'N/A'
+    return str(value)
+
+
 class GoogleSheetsManager:
     def __init__(self, service_account_file="service_account.json"):
         """Initialize Google Sheets manager with service account"""
@@ -74,34 +285,56 @@ class GoogleSheetsManager:
             st.error("2. Proper secrets configured in Streamlit Cloud")
             return False
     
-    def create_sheet_from_dataframe(self, df, sheet_name, share_with_anyone=True):
-        """Create a Google Sheet from DataFrame data"""
+    def create_sheet_from_records(self, records, sheet_name, share_with_anyone=True):
+        """Create a Google Sheet from a list of listing dicts or Listing records"""
         try:
-            if df is None or len(df) == 0:
+            if not records:
                 st.error("No data provided for Google Sheet creation")
                 return None, None
             
-            st.info(f"Creating sheet with {len(df)} rows of data")
+            st.info(f"Creating sheet with {len(records)} rows of data")
             
-            # Clean the data - replace NaN values and handle problematic data
-            df = df.fillna('N/A')
-            df = df.astype(str)
+            # Convert records to rows of text lazily; the request builders consume them directly,
+            # skipping an intermediate list-of-lists copy of the whole sheet
+            if is_dataclass(records[0]):
+                columns = [record_field.name for record_field in fields(records[0])]
+                rows = ([getattr(record, column) for column in columns] for record in records)
+            else:
+                columns = list(records[0].keys())
+                rows = ([record.get(column) for column in columns] for record in records)
+            num_rows = len(records) + 1
+            data = itertools.chain([columns], ([_cell_text(value) for value in row] for row in rows))
             
             # Create new spreadsheet
             spreadsheet = self.client.create(sheet_name)
             st.success(f"Created spreadsheet: {sheet_name}")
             
-            # Get the first worksheet
             worksheet = spreadsheet.sheet1
-            worksheet.clear()
-            
-            # Upload data to sheet
-            data = [df.columns.tolist()] + df.values.tolist()
-            worksheet.update(data, value_input_option='RAW')
-            st.info(f"Uploaded {len(data)} rows to sheet")
-            
-            # Format the header row
-            self._format_header(worksheet, len(df.columns))
+            if len(records) > CHUNKED_UPLOAD_MIN_ROWS:
+                # Large data: size the grid and format the header, then send plain value arrays
+                # (far smaller than per-cell JSON) in chunks. RAW keeps every cell as text, the
+                # same as the small-sheet path, so cell types never depend on the row count.
+                spreadsheet.batch_update({"requests": [
+                    self._resize_request(worksheet.id, num_rows, len(columns)),
+                    self._header_format_request(worksheet.id)
+                ]})
+                start_row = 1
+                while chunk := list(itertools.islice(data, UPLOAD_CHUNK_ROWS)):
+                    spreadsheet.values_update(
+                        f"'{worksheet.title}'!A{start_row}",
+                        params={"valueInputOption": "RAW"},
+                        body={"values": chunk}
+                    )
+                    start_row += len(chunk)
+                st.info(f"Uploaded {num_rows} rows to sheet in chunks of {UPLOAD_CHUNK_ROWS}")
+            else:
+                # Upload data and format the header row in a single batchUpdate request
+                spreadsheet.batch_update({"requests": [
+                    self._resize_request(worksheet.id, num_rows, len(columns)),
+                    self._values_request(worksheet.id, data),
+                    self._header_format_request(worksheet.id)
+                ]})
+                st.info(f"Uploaded {num_rows} rows to sheet")
             
             # Share the spreadsheet if requested
             sheet_url = spreadsheet.url
@@ -119,17 +352,45 @@ class GoogleSheetsManager:
             st.error(f"Failed to create Google Sheet: {e}")
             return None, None
     
-    def _format_header(self, worksheet, num_columns):
-        """Format the header row with bold text and background color"""
-        try:
-            header_format = {
-                "backgroundColor": {"red": 0.9, "green": 0.9, "blue": 0.9},
-                "textFormat": {"bold": True},
-                "horizontalAlignment": "CENTER"
+    def _resize_request(self, sheet_id, num_rows, num_columns):
+        """Build a request sizing the worksheet grid to fit the data"""
+        return {
+            "updateSheetProperties": {
+                "properties": {
+                    "sheetId": sheet_id,
+                    "gridProperties": {"rowCount": num_rows, "columnCount": num_columns}
+                },
+                "fields": "gridProperties(rowCount,columnCount)"
             }
-            worksheet.format(f"1:{1}", header_format)
-        except Exception as e:
-            st.warning(f"Header formatting failed: {e}")
+        }
+    
+    def _values_request(self, sheet_id, data):
+        """Build a request writing rows of strings starting at A1 (equivalent to RAW input)"""
+        return {
+            "updateCells": {
+                "rows": [
+                    {"values": [{"userEnteredValue": {"stringValue": value}} for value in row]}
+                    for row in data
+                ],
+                "fields": "userEnteredValue",
+                "start": {"sheetId": sheet_id, "rowIndex": 0, "columnIndex": 0}
+            }
+        }
+    
+    def _header_format_request(self, sheet_id):
+        """Build a request formatting the header row with bold text and background color"""
+        header_format = {
+            "backgroundColor": {"red": 0.9, "green": 0.9, "blue": 0.9},
+            "textFormat": {"bold": True},
+            "horizontalAlignment": "CENTER"
+        }
+        return {
+            "repeatCell": {
+                "range": {"sheetId": sheet_id, "startRowIndex": 0, "endRowIndex": 1},
+                "cell": {"userEnteredFormat": header_format},
+                "fields": "userEnteredFormat(backgroundColor,textFormat,horizontalAlignment)"
+            }
+        }
     
     def _share_with_anyone(self, spreadsheet):
         """Make the spreadsheet editable by anyone with the link"""
@@ -153,160 +414,218 @@ class GoogleSheetsManager:
             return False
 
 
-class CraigslistScraper:
-    def __init__(self):
-        self.driver = None
+@functools.lru_cache(maxsize=None)
+def resolve_chromedriver_path():
+    """Find a chromedriver binary, checking the local copy before common cloud paths"""
+    for path in (LOCAL_CHROMEDRIVER, "/usr/bin/chromedriver", "/usr/local/bin/chromedriver"):
+        if os.path.exists(path):
+            return path
+    return None
+
+
+@st.cache_data
+def session_file_exists(path):
+    """Check for a saved Facebook session once across reruns, until save_session clears the cache"""
+    return os.path.exists(path)
+
+
+@st.cache_data(ttl=60)
+def _check_paths():
+    """Check which local setup files exist, cached briefly so reruns don't re-stat them"""
+    return {
+        "chromedriver": os.path.exists(LOCAL_CHROMEDRIVER),
+        "service_account": os.path.exists("service_account.json"),
+        "fb_session": session_file_exists(FB_SESSION_FILE),
+    }
+
+
+def create_driver(headless=True, driver_path=None):
+    """Set up a Chrome driver usable by both the Craigslist and Facebook scrapers"""
+    try:
+        chrome_options = Options()
+        if headless:
+            chrome_options.add_argument("--headless")
         
-    def setup_driver(self, headless=True):
-        """Set up Chrome driver"""
+        # Return from driver.get() at DOMContentLoaded; explicit waits cover readiness
+        chrome_options.page_load_strategy = "eager"
+        
+        # Basic Chrome options
+        chrome_options.add_argument("--no-sandbox")
+        chrome_options.add_argument("--disable-dev-shm-usage")
+        chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        chrome_options.add_experimental_option('useAutomationExtension', False)
+        chrome_options.add_argument("--window-size=1920,1080")
+        chrome_options.add_argument("--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/139.0.0.0 Safari/537.36")
+        
+        # Additional options for cloud environments
+        chrome_options.add_argument("--disable-extensions")
+        chrome_options.add_argument("--disable-plugins")
+        chrome_options.add_argument("--disable-images")
+        # Skip page weight that isn't scraped; Facebook headless runs share this browser too
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.notifications": 2,
+            "profile.managed_default_content_settings.media_stream": 2
+        })
+        if headless:
+            chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        # Let Chrome pick a free DevTools port so parallel workers don't collide
+        chrome_options.add_argument("--remote-debugging-port=0")
+        
+        # Pool workers receive the path resolved by the parent; None lets Selenium Manager find one
+        if driver_path is None:
+            driver_path = resolve_chromedriver_path()
+        service = Service(driver_path) if driver_path else Service()
+        if driver_path == LOCAL_CHROMEDRIVER:
+            st.info("Using local ChromeDriver")
+        else:
+            st.info("Using cloud-provided ChromeDriver")
+        
+        driver = webdriver.Chrome(service=service, options=chrome_options)
+
+        # Execute script to remove webdriver property
+        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        
+        block_heavy_resources(driver)
+
+        return driver
+
+    except Exception as e:
+        st.error(f"Failed to setup Chrome driver: {e}")
+        st.error("Trying alternative Chrome setup for cloud environment...")
+        
+        # Fallback attempt with minimal options
         try:
             chrome_options = Options()
-            if headless:
-                chrome_options.add_argument("--headless")
-            
-            # Basic Chrome options
+            chrome_options.add_argument("--headless")
             chrome_options.add_argument("--no-sandbox")
             chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument("--disable-gpu")
-            chrome_options.add_argument("--window-size=1920,1080")
-            chrome_options.add_argument("--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/139.0.0.0 Safari/537.36")
-            
-            # Additional options for cloud environments
-            chrome_options.add_argument("--disable-extensions")
-            chrome_options.add_argument("--disable-plugins")
-            chrome_options.add_argument("--disable-images")
-            chrome_options.add_argument("--remote-debugging-port=9222")
-            
-            # Try different Chrome/Chromium paths for cloud compatibility
-            service = None
-            driver_path = "./chromedriver"
-            
-            if os.path.exists(driver_path):
-                # Local development
-                service = Service(driver_path)
-                st.info("Using local ChromeDriver")
-            else:
-                # Cloud deployment - try multiple paths
-                cloud_paths = [
-                    "/usr/bin/chromedriver",  # Common Linux path
-                    "/usr/local/bin/chromedriver",  # Alternative path
-                    "chromedriver"  # System PATH
-                ]
-                
-                for path in cloud_paths:
-                    try:
-                        if path == "chromedriver":
-                            service = Service()  # Use PATH
-                        else:
-                            if os.path.exists(path):
-                                service = Service(path)
-                                break
-                    except:
-                        continue
-                
-                if service is None:
-                    # Last resort - try with chromium
-                    chrome_options.binary_location = "/usr/bin/chromium"
-                    service = Service()
-                
-                st.info("Using cloud-provided ChromeDriver")
-            
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            return self.driver
-            
-        except Exception as e:
-            st.error(f"Failed to setup Chrome driver: {e}")
-            st.error("Trying alternative Chrome setup for cloud environment...")
+            chrome_options.binary_location = "/usr/bin/chromium"
             
-            # Fallback attempt with minimal options
-            try:
-                chrome_options = Options()
-                chrome_options.add_argument("--headless")
-                chrome_options.add_argument("--no-sandbox")
-                chrome_options.add_argument("--disable-dev-shm-usage")
-                chrome_options.binary_location = "/usr/bin/chromium"
-                
-                self.driver = webdriver.Chrome(options=chrome_options)
-                st.success("Fallback Chrome setup successful")
-                return self.driver
-            except Exception as e2:
-                st.error(f"Fallback also failed: {e2}")
-                return None
+            driver = webdriver.Chrome(options=chrome_options)
+            st.success("Fallback Chrome setup successful")
+            return driver
+        except Exception as e2:
+            st.error(f"Fallback also failed: {e2}")
+            return None
+
+
+def block_heavy_resources(driver):
+    """Block images, media, fonts, CSS and trackers in the driver's current tab"""
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(BLOCKED_URL_PATTERNS)})
+    except Exception as e:
+        st.warning(f"Could not block page resources: {e}")
+
+
+def get_or_create_driver():
+    """Return the headless Chrome driver shared by this session, starting it on first use"""
+    driver = st.session_state.get('shared_driver')
+    if driver is not None:
+        try:
+            driver.window_handles
+            return driver
+        except Exception:
+            st.warning("Shared Chrome driver stopped responding, starting a new one...")
+    
+    driver = create_driver(headless=True)
+    if driver:
+        atexit.register(_quit_driver, driver)
+    st.session_state.shared_driver = driver
+    return driver
+
+
+def get_scraper(key, scraper_class, driver):
+    """Return this session's scraper, reused across reruns until the shared driver changes"""
+    cached = st.session_state.get(key)
+    if cached is None or cached[0] is not driver:
+        cached = (driver, scraper_class(driver))
+        st.session_state[key] = cached
+    return cached[1]
+
+
+def reset_scrapers():
+    """Quit the shared driver and drop cached scrapers so the next run starts fresh"""
+    driver = st.session_state.pop('shared_driver', None)
+    if driver is not None:
+        _quit_driver(driver)
+    for key in ('cl_scraper', 'fb_scraper'):
+        st.session_state.pop(key, None)
+
+
+def _pause_before_request():
+    """Sleep a random CRAIGSLIST_REQUEST_DELAY before loading another Craigslist listing page"""
+    time.sleep(random.uniform(*CRAIGSLIST_REQUEST_DELAY))
+
+
+def _quit_driver(driver):
+    """Quit a Chrome driver, ignoring errors from an already-dead browser"""
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+
+class CraigslistScraper:
+    def __init__(self, driver=None):
+        self.driver = driver
+        
+    def setup_driver(self, headless=True):
+        """Set up Chrome driver"""
+        self.driver = create_driver(headless)
+        return self.driver
 
     def extract_listing_urls(self, search_url):
         """Extract all listing URLs from the search page"""
         st.info(f"Loading Craigslist search page...")
         self.driver.get(search_url)
         
-        # Wait for page to load completely
-        with st.spinner("Waiting for page to load completely (60 seconds)..."):
-            time.sleep(60)
-        
-        # Additional wait for dynamic content
+        # Wait for listings to appear (returns as soon as any result selector matches)
         try:
-            st.info("Waiting for listings to appear...")
-            wait = WebDriverWait(self.driver, 30)
-            wait.until(lambda driver: 
-                      len(driver.find_elements(By.CLASS_NAME, "result-node")) > 0 or
-                      len(driver.find_elements(By.CSS_SELECTOR, ".cl-search-result")) > 0 or
-                      len(driver.find_elements(By.CSS_SELECTOR, "[data-pid]")) > 0)
+            with st.spinner("Waiting for listings to appear (up to 60 seconds)..."):
+                wait = WebDriverWait(self.driver, 60)
+                wait.until(EC.any_of(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, ".result-node")),
+                    EC.presence_of_element_located((By.CSS_SELECTOR, ".cl-search-result")),
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "[data-pid]"))
+                ))
             st.success("Listings detected, proceeding with extraction...")
-        except:
+        except TimeoutException:
             st.warning("Timeout waiting for listings, but continuing anyway...")
         
         st.info("Looking for listing URLs...")
         
         listing_urls = []
+        seen_urls = set()  # For duplicate detection
+        search_parts = urlparse(search_url)
+        origin = f"{search_parts.scheme}://{search_parts.netloc}"
         try:
-            # Look for result-node elements
-            result_nodes = self.driver.find_elements(By.CLASS_NAME, "result-node")
-            st.info(f"Found {len(result_nodes)} result nodes")
-            
-            for node in result_nodes:
-                try:
-                    link_elements = node.find_elements(By.CSS_SELECTOR, "a.cl-app-anchor")
-                    for link in link_elements:
-                        href = link.get_attribute('href')
-                        if href and '/d/' in href:
-                            full_url = urljoin(search_url, href)
-                            if full_url not in listing_urls:
-                                listing_urls.append(full_url)
-                                break
-                except Exception as e:
-                    continue
+            # Collect the links of every search result strategy in one round-trip
+            strategies = self.driver.execute_script(
+                CRAIGSLIST_SEARCH_JS, [(container, link) for container, link, _ in CL_SEARCH_STRATEGIES]
+            )
             
-            # Try alternative selectors if no results
-            if len(listing_urls) == 0:
-                st.info("No result-node elements found, trying alternative selectors...")
+            for attempt, ((_, _, label), nodes) in enumerate(zip(CL_SEARCH_STRATEGIES, strategies)):
+                if attempt:
+                    st.info("No listing links found, trying alternative selectors...")
+                st.info(f"Found {len(nodes)} {label}")
                 
-                search_results = self.driver.find_elements(By.CSS_SELECTOR, ".cl-search-result")
-                st.info(f"Found {len(search_results)} cl-search-result elements")
-                
-                for result in search_results:
-                    try:
-                        link = result.find_element(By.CSS_SELECTOR, "a")
-                        href = link.get_attribute('href')
-                        if href and '/d/' in href:
-                            full_url = urljoin(search_url, href)
-                            if full_url not in listing_urls:
+                # Take the first listing link of each result
+                for hrefs in nodes:
+                    for href in hrefs:
+                        if '/d/' in href:
+                            full_url = _absolute_url(href, origin, search_url)
+                            if full_url not in seen_urls:
+                                seen_urls.add(full_url)
                                 listing_urls.append(full_url)
-                    except:
-                        continue
+                                break
                 
-                if len(listing_urls) == 0:
-                    pid_elements = self.driver.find_elements(By.CSS_SELECTOR, "[data-pid]")
-                    st.info(f"Found {len(pid_elements)} elements with data-pid")
-                    
-                    for element in pid_elements:
-                        try:
-                            link = element.find_element(By.CSS_SELECTOR, "a")
-                            href = link.get_attribute('href')
-                            if href and '/d/' in href:
-                                full_url = urljoin(search_url, href)
-                                if full_url not in listing_urls:
-                                    listing_urls.append(full_url)
-                        except:
-                            continue
+                # Try alternative selectors only if no results
+                if listing_urls:
+                    break
             
             st.success(f"Extracted {len(listing_urls)} unique listing URLs")
             return listing_urls
@@ -315,132 +634,87 @@ class CraigslistScraper:
             st.error(f"Error finding listing URLs: {e}")
             return []
 
-    def safe_find_element_text(self, selector, method="css"):
-        """Safely find element and return text, or empty string if not found"""
-        try:
-            if method == "css":
-                element = self.driver.find_element(By.CSS_SELECTOR, selector)
-            elif method == "class":
-                element = self.driver.find_element(By.CLASS_NAME, selector)
-            elif method == "id":
-                element = self.driver.find_element(By.ID, selector)
-            elif method == "xpath":
-                element = self.driver.find_element(By.XPATH, selector)
-            else:
-                element = self.driver.find_element(By.CSS_SELECTOR, selector)
-            
-            return element.text.strip()
-        except:
-            return ''
-
-    def safe_find_element_attribute(self, selector, attribute, method="css"):
-        """Safely find element and return attribute value, or empty string if not found"""
+    def fetch_listing_urls(self, search_url):
+        """Extract listing URLs from the static search page HTML, returning None when a browser is needed"""
+        st.info("Fetching Craigslist search page without a browser...")
         try:
-            if method == "css":
-                element = self.driver.find_element(By.CSS_SELECTOR, selector)
-            elif method == "class":
-                element = self.driver.find_element(By.CLASS_NAME, selector)
-            elif method == "id":
-                element = self.driver.find_element(By.ID, selector)
-            elif method == "xpath":
-                element = self.driver.find_element(By.XPATH, selector)
-            else:
-                element = self.driver.find_element(By.CSS_SELECTOR, selector)
-            
-            return element.get_attribute(attribute) or ''
-        except:
-            return ''
+            response = requests.get(search_url, headers=CRAIGSLIST_HTTP_HEADERS, timeout=CRAIGSLIST_HTTP_TIMEOUT)
+        except requests.RequestException as e:
+            st.info(f"Lightweight fetch failed ({e}), falling back to the browser")
+            return None
+        
+        if response.status_code != 200:
+            st.info(f"Craigslist returned HTTP {response.status_code}, falling back to the browser")
+            return None
+        
+        parser = _LinkParser()
+        parser.feed(response.text)
+        
+        listing_urls = []
+        seen_urls = set()  # For duplicate detection
+        page_parts = urlparse(response.url)
+        origin = f"{page_parts.scheme}://{page_parts.netloc}"
+        for href in parser.hrefs:
+            if '/d/' in href:
+                full_url = _absolute_url(href, origin, response.url)
+                if full_url not in seen_urls:
+                    seen_urls.add(full_url)
+                    listing_urls.append(full_url)
+        
+        # An anti-bot challenge page comes back as 200 with no listing links
+        if not listing_urls:
+            st.info("No listings in the static page (possibly a challenge page), falling back to the browser")
+            return None
+        
+        st.success(f"Extracted {len(listing_urls)} unique listing URLs without a browser")
+        return listing_urls
 
-    def extract_listing_details(self, listing_url, index):
+    def extract_listing_details(self, listing_url, navigate=True):
         """Extract detailed information from a single listing page"""
         try:
-            self.driver.get(listing_url)
-            time.sleep(3)
-            
-            listing_data = {
-                'url': listing_url,
-                'title': '',
-                'price': '',
-                'year': '',
-                'make': '',
-                'model': '',
-                'vin': '',
-                'mileage': '',
-                'cylinders': '',
-                'drive': '',
-                'fuel': '',
-                'color': '',
-                'transmission': '',
-                'type': '',
-                'location': '',
-                'google_maps_link': '',
-                'date_posted': '',
-                'date_scraped': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                'source': 'Craigslist'
-            }
+            if navigate:
+                self.driver.get(listing_url)
             
-            # Extract title
-            title = self.safe_find_element_text("#titletextonly", "id")
-            if not title:
-                title = self.safe_find_element_text(".postingtitletext .titletextonly", "css")
-            if not title:
-                title = self.safe_find_element_text("h1 .titletextonly", "css")
-            if not title:
-                title = self.safe_find_element_text(".postingtitle", "css")
-            
-            if title:
-                listing_data['title'] = title
-                # Parse make/model from title
-                title_match = re.match(r'(\d{4})\s+([A-Za-z]+)\s+([A-Za-z0-9\-\s]+)', title)
+            # Wait for the posting title instead of a fixed delay
+            try:
+                WebDriverWait(self.driver, 10).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, ".postingtitle, #titletextonly"))
+                )
+            except TimeoutException:
+                pass
+            
+            # Read every field in one round-trip, keeping only the ones found on the page
+            scraped = self.driver.execute_script(CRAIGSLIST_DETAILS_JS, CL_FIELDS)
+            listing_data = Listing(url=listing_url, **{
+                name: value for name, value in scraped.items() if value and name in LISTING_FIELD_NAMES
+            })
+            
+            # Parse make/model from title
+            if listing_data.title:
+                title_match = TITLE_RE.match(listing_data.title)
                 if title_match:
-                    listing_data['year'] = title_match.group(1)
-                    listing_data['make'] = title_match.group(2)
-                    listing_data['model'] = title_match.group(3).strip()
+                    listing_data.year = title_match.group(1)
+                    listing_data.make = title_match.group(2)
+                    listing_data.model = title_match.group(3).strip()
             else:
                 url_title = listing_url.split('/')[-1].replace('.html', '').replace('-', ' ').title()
-                listing_data['title'] = url_title
-            
-            # Extract other details
-            listing_data['price'] = self.safe_find_element_text(".price", "css")
-            listing_data['vin'] = self.safe_find_element_text(".attr.auto_vin .valu", "css")
-            listing_data['mileage'] = self.safe_find_element_text(".attr.auto_miles .valu", "css")
-            listing_data['cylinders'] = self.safe_find_element_text(".attr.auto_cylinders .valu", "css")
-            listing_data['drive'] = self.safe_find_element_text(".attr.auto_drivetrain .valu", "css")
-            listing_data['fuel'] = self.safe_find_element_text(".attr.auto_fuel_type .valu", "css")
-            listing_data['color'] = self.safe_find_element_text(".attr.auto_paint .valu", "css")
-            listing_data['transmission'] = self.safe_find_element_text(".attr.auto_transmission .valu", "css")
-            listing_data['type'] = self.safe_find_element_text(".attr.auto_bodytype .valu", "css")
+                listing_data.title = url_title
             
             # Extract location
             location_parts = []
-            primary_location = self.safe_find_element_text(".postingtitletext small", "css")
+            primary_location = scraped['primary_location']
             if primary_location:
-                location_clean = re.sub(r'[()]', '', primary_location).strip()
+                location_clean = PARENS_RE.sub('', primary_location).strip()
                 location_parts.append(location_clean)
             
-            address = self.safe_find_element_text(".mapaddress", "css")
+            address = scraped['address']
             if address:
-                address_clean = re.sub(r'google map.*$', '', address, flags=re.IGNORECASE).strip()
+                address_clean = GMAP_RE.sub('', address).strip()
                 if address_clean and address_clean not in location_parts:
                     location_parts.append(address_clean)
             
             if location_parts:
-                listing_data['location'] = " - ".join(location_parts)
-            
-            # Extract Google Maps link
-            listing_data['google_maps_link'] = self.safe_find_element_attribute(".mapaddress a", "href", "css")
-            
-            # Extract posting date
-            date_posted = self.safe_find_element_attribute("time.date.timeago", "datetime", "css")
-            if not date_posted:
-                date_posted = self.safe_find_element_attribute("time.date.timeago", "title", "css")
-            if not date_posted:
-                date_posted = self.safe_find_element_text("time.date.timeago", "css")
-            if not date_posted:
-                date_posted = self.safe_find_element_text(".postinginfos .postinginfo:first-child .date", "css")
-            
-            if date_posted:
-                listing_data['date_posted'] = date_posted
+                listing_data.location = " - ".join(location_parts)
             
             return listing_data
             
@@ -448,14 +722,61 @@ class CraigslistScraper:
             st.error(f"Error extracting details from {listing_url}: {e}")
             return None
 
-    def scrape_craigslist(self, search_url, max_listings=None):
+    def open_loading_tab(self, url):
+        """Start loading url in a new background tab and return the tab's handle"""
+        existing_tabs = set(self.driver.window_handles)
+        self.driver.execute_script("window.open(arguments[0], '_blank');", url)
+        return (set(self.driver.window_handles) - existing_tabs).pop()
+
+    def extract_listings_in_tabs(self, listing_urls, concurrency=CRAIGSLIST_TAB_CONCURRENCY):
+        """Yield listing details, keeping up to `concurrency` listing pages loading at once in tabs of this browser"""
+        search_tab = self.driver.current_window_handle
+        remaining_urls = iter(listing_urls)
+        loading_tabs = deque()
+        try:
+            while True:
+                # Top up the window of pages loading in the background
+                while len(loading_tabs) < concurrency:
+                    listing_url = next(remaining_urls, None)
+                    if listing_url is None:
+                        break
+                    _pause_before_request()
+                    loading_tabs.append((listing_url, self.open_loading_tab(listing_url)))
+                
+                if not loading_tabs:
+                    break
+                
+                listing_url, tab = loading_tabs.popleft()
+                self.driver.switch_to.window(tab)
+                try:
+                    listing_data = self.extract_listing_details(listing_url, navigate=False)
+                finally:
+                    # Close only the listing tab, then return to the search tab so the
+                    # driver never points at a closed window when opening the next tab
+                    self.driver.close()
+                    self.driver.switch_to.window(search_tab)
+                yield listing_data
+        finally:
+            for _, tab in loading_tabs:
+                try:
+                    self.driver.switch_to.window(tab)
+                    self.driver.close()
+                except Exception:
+                    pass
+            self.driver.switch_to.window(search_tab)
+
+    def scrape_craigslist(self, search_url, max_listings=None, workers=CRAIGSLIST_WORKERS, use_lightweight=True):
         """Main Craigslist scraping function"""
         try:
-            if not self.setup_driver(headless=True):
+            if not self.driver and not self.setup_driver(headless=True):
                 return []
             
-            # Step 1: Extract all listing URLs
-            listing_urls = self.extract_listing_urls(search_url)
+            # Step 1: Extract all listing URLs, only rendering the search page when plain HTTP fails
+            listing_urls = self.fetch_listing_urls(search_url) if use_lightweight else None
+            if listing_urls is None:
+                # Run the search in the browser's primary tab
+                self.driver.switch_to.window(self.driver.window_handles[0])
+                listing_urls = self.extract_listing_urls(search_url)
             
             if not listing_urls:
                 st.error("No listing URLs found!")
@@ -466,7 +787,8 @@ class CraigslistScraper:
                 listing_urls = listing_urls[:max_listings]
                 st.info(f"Limited to first {max_listings} listings")
             
-            st.info(f"Processing {len(listing_urls)} listings...")
+            workers = max(1, min(workers, len(listing_urls)))
+            st.info(f"Processing {len(listing_urls)} listings with {workers} browser workers...")
             
             # Step 2: Extract detailed data from each listing
             all_listings = []
@@ -476,13 +798,22 @@ class CraigslistScraper:
             progress_bar = st.progress(0)
             status_text = st.empty()
             
-            for i, url in enumerate(listing_urls):
-                try:
-                    status_text.text(f"Processing Craigslist listing {i+1}/{len(listing_urls)}")
-                    
-                    listing_data = self.extract_listing_details(url, i)
+            pool = None
+            if workers > 1:
+                # Each worker process owns its own Chrome driver (Selenium is not thread-safe);
+                # resolve the driver path once here rather than in every worker
+                pool = multiprocessing.Pool(processes=workers, initializer=_init_worker_driver,
+                                            initargs=(resolve_chromedriver_path(),))
+                results = pool.imap_unordered(_extract_listing_worker, listing_urls, chunksize=1)
+            else:
+                # A single worker loads several listings at once in tabs of this browser
+                results = self.extract_listings_in_tabs(listing_urls)
+            
+            try:
+                for i, listing_data in enumerate(results):
+                    status_text.text(f"Processed Craigslist listing {i+1}/{len(listing_urls)}")
                     
-                    if listing_data and (listing_data['title'] or listing_data['price'] or listing_data['vin']):
+                    if listing_data and (listing_data.title or listing_data.price or listing_data.vin):
                         all_listings.append(listing_data)
                         successful_extractions += 1
                         
@@ -490,13 +821,24 @@ class CraigslistScraper:
                     
                     # Update progress
                     progress_bar.progress((i + 1) / len(listing_urls))
-                    
-                    # Small delay between requests
-                    time.sleep(2)
-                    
-                except Exception as e:
-                    st.error(f"Error processing listing {i+1}: {e}")
-                    continue
+                
+                if pool:
+                    # Close gracefully so workers run their driver cleanup
+                    pool.close()
+            except Exception as e:
+                st.error(f"Error processing Craigslist listings: {e}")
+                if pool:
+                    pool.terminate()
+            except BaseException:
+                # Streamlit stop/rerun or Ctrl+C: stop the workers before join(), then re-raise
+                if pool:
+                    pool.terminate()
+                raise
+            finally:
+                if pool:
+                    pool.join()
+                else:
+                    results.close()
             
             status_text.text("Craigslist scraping completed!")
             st.success(f"Successfully extracted data from {successful_extractions}/{len(listing_urls)} Craigslist listings")
@@ -506,17 +848,75 @@ class CraigslistScraper:
         except Exception as e:
             st.error(f"Error in Craigslist scraping: {e}")
             return []
-        
-        finally:
-            if self.driver:
-                self.driver.quit()
+
+
+# Per-process Chrome driver used by the Craigslist worker pool
+_worker_driver = None
+
+
+def _init_worker_driver(driver_path):
+    """Start a headless Chrome driver for this worker process"""
+    global _worker_driver
+    _worker_driver = create_driver(headless=True, driver_path=driver_path)
+    # Pool workers exit via os._exit, so use a multiprocessing finalizer rather than atexit
+    multiprocessing.util.Finalize(None, _quit_worker_driver, exitpriority=10)
+    # Pool.terminate() sends SIGTERM, which skips finalizers, so quit the driver there too
+    signal.signal(signal.SIGTERM, _terminate_worker)
+
+
+def _quit_worker_driver():
+    """Quit this worker process's Chrome driver"""
+    global _worker_driver
+    if _worker_driver:
+        _quit_driver(_worker_driver)
+        _worker_driver = None
+
+
+def _terminate_worker(signum, frame):
+    """Quit this worker's Chrome driver and exit when the pool terminates it"""
+    _quit_worker_driver()
+    os._exit(0)
+
+
+def _extract_listing_worker(listing_url):
+    """Extract a single Craigslist listing using this worker's driver"""
+    if _worker_driver is None:
+        return None
+    _pause_before_request()
+    return CraigslistScraper(_worker_driver).extract_listing_details(listing_url)
 
 
 class FacebookMarketplaceScraper:
-    def __init__(self):
+    def __init__(self, driver=None):
+        self.shared_driver = driver
         self.driver = None
-        self.session_file = "facebook_session.pkl"
+        self.session_file = FB_SESSION_FILE
         
+    def open_headless_driver(self):
+        """Open a tab in the shared browser if one was provided, otherwise start a headless driver"""
+        if self.shared_driver:
+            try:
+                self.shared_driver.switch_to.new_window('tab')
+                self.driver = self.shared_driver
+                return self.driver
+            except Exception as e:
+                st.warning(f"Could not open a tab in the shared browser: {e}")
+        return self.setup_facebook_driver(headless=True)
+
+    def close_driver(self):
+        """Close this scraper's tab in a shared browser, or quit its own driver"""
+        if not self.driver:
+            return
+        try:
+            if self.driver is self.shared_driver:
+                self.driver.close()
+                self.driver.switch_to.window(self.driver.window_handles[0])
+            else:
+                self.driver.quit()
+        except Exception:
+            pass
+        self.driver = None
+
     def setup_facebook_driver(self, headless=False):
         """Set up Chrome driver with Facebook-specific settings"""
         try:
@@ -525,6 +925,9 @@ class FacebookMarketplaceScraper:
             if headless:
                 chrome_options.add_argument("--headless")
             
+            # Return from driver.get() at DOMContentLoaded instead of waiting for every subresource
+            chrome_options.page_load_strategy = "eager"
+            
             # Facebook-specific settings to avoid detection
             chrome_options.add_argument("--no-sandbox")
             chrome_options.add_argument("--disable-dev-shm-usage")
@@ -542,38 +945,23 @@ class FacebookMarketplaceScraper:
             chrome_options.add_argument("--disable-plugins")
             chrome_options.add_argument("--disable-images")  # Faster loading
             
-            # Try different Chrome/Chromium paths for cloud compatibility
-            service = None
-            driver_path = "./chromedriver"
-            
-            if os.path.exists(driver_path):
-                # Local development
-                service = Service(driver_path)
+            # Skip page weight that isn't scraped; titles come from img alt text, which survives
+            prefs = {
+                "profile.default_content_setting_values.notifications": 2,
+                "profile.managed_default_content_settings.media_stream": 2
+            }
+            if headless:
+                # Keep images in the visible login window so captchas still render
+                prefs["profile.managed_default_content_settings.images"] = 2
+                chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+            chrome_options.add_experimental_option("prefs", prefs)
+            
+            # None lets Selenium Manager find a driver
+            driver_path = resolve_chromedriver_path()
+            service = Service(driver_path) if driver_path else Service()
+            if driver_path == LOCAL_CHROMEDRIVER:
                 st.info("Using local ChromeDriver for Facebook")
             else:
-                # Cloud deployment - try multiple paths
-                cloud_paths = [
-                    "/usr/bin/chromedriver",  # Common Linux path
-                    "/usr/local/bin/chromedriver",  # Alternative path
-                    "chromedriver"  # System PATH
-                ]
-                
-                for path in cloud_paths:
-                    try:
-                        if path == "chromedriver":
-                            service = Service()  # Use PATH
-                        else:
-                            if os.path.exists(path):
-                                service = Service(path)
-                                break
-                    except:
-                        continue
-                
-                if service is None:
-                    # Last resort - try with chromium
-                    chrome_options.binary_location = "/usr/bin/chromium"
-                    service = Service()
-                
                 st.info("Using cloud-provided ChromeDriver for Facebook")
             
             self.driver = webdriver.Chrome(service=service, options=chrome_options)
@@ -606,8 +994,10 @@ class FacebookMarketplaceScraper:
         """Save browser cookies for session persistence"""
         try:
             cookies = self.driver.get_cookies()
-            with open(self.session_file, 'wb') as f:
-                pickle.dump(cookies, f)
+            with open(self.session_file, 'w') as f:
+                json.dump(cookies, f)
+            session_file_exists.clear()
+            _check_paths.clear()
             st.success(f"Session saved to {self.session_file}")
             return True
         except Exception as e:
@@ -617,16 +1007,15 @@ class FacebookMarketplaceScraper:
     def load_session(self):
         """Load saved cookies to restore session"""
         try:
-            if not os.path.exists(self.session_file):
+            if not session_file_exists(self.session_file):
                 st.info(f"No saved session found at {self.session_file}")
                 return False
             
-            with open(self.session_file, 'rb') as f:
-                cookies = pickle.load(f)
+            with open(self.session_file, 'r') as f:
+                cookies = json.load(f)
             
-            # First navigate to Facebook to set the domain context
-            self.driver.get("https://www.facebook.com")
-            time.sleep(2)
+            # Cookies need a page on the Facebook domain; robots.txt is a tiny one
+            self.driver.get("https://www.facebook.com/robots.txt")
             
             # Load all cookies
             for cookie in cookies:
@@ -641,27 +1030,29 @@ class FacebookMarketplaceScraper:
             st.error(f"Failed to load session: {e}")
             return False
 
+    def wait_for_listings(self, timeout=15):
+        """Wait until a marketplace listing link is present, returning False on timeout"""
+        try:
+            WebDriverWait(self.driver, timeout).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "a[href*='/marketplace/item/']"))
+            )
+            return True
+        except TimeoutException:
+            return False
+
     def get_listing_count(self):
         """Count Facebook Marketplace listings using multiple selector strategies"""
         try:
-            # Strategy 1: Look for marketplace item links
-            marketplace_links = self.driver.find_elements(By.CSS_SELECTOR, "a[href*='/marketplace/item/']")
-            
-            # Strategy 2: Look for the specific container structure
-            container_selectors = [
-                "a[href*='/marketplace/item/']",  # Most reliable
-                "[data-testid*='marketplace']",
-                "div[data-testid='marketplace-grid'] a",
-                "div[role='main'] a[href*='/marketplace/item/']"
-            ]
-            
-            max_count = 0
-            for selector in container_selectors:
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    max_count = max(max_count, len(elements))
-                except:
-                    continue
+            # Count every selector strategy in a single browser round-trip
+            max_count = self.driver.execute_script(
+                FB_LISTING_COUNT_JS,
+                [
+                    "a[href*='/marketplace/item/']",  # Most reliable
+                    "[data-testid*='marketplace']",
+                    "div[data-testid='marketplace-grid'] a",
+                    "div[role='main'] a[href*='/marketplace/item/']"
+                ]
+            )
             
             return max_count
             
@@ -669,6 +1060,17 @@ class FacebookMarketplaceScraper:
             st.error(f"Error counting listings: {e}")
             return 0
 
+    def poll_listing_count(self, timeout=15, initial_delay=0.5, max_delay=4):
+        """Poll the listing count with exponential backoff, returning as soon as it is non-zero"""
+        deadline = time.time() + timeout
+        delay = initial_delay
+        count = self.get_listing_count()
+        while count == 0 and time.time() < deadline:
+            time.sleep(min(delay, max(deadline - time.time(), 0)))
+            delay = min(delay * 2, max_delay)
+            count = self.get_listing_count()
+        return count
+
     def wait_and_scroll(self, scroll_attempts=10, scroll_delay=3):
         """Perform infinite scroll to load all listings"""
         st.info(f"Starting Facebook infinite scroll (max {scroll_attempts} attempts)...")
@@ -702,14 +1104,14 @@ class FacebookMarketplaceScraper:
             # Wait for new content to load
             time.sleep(scroll_delay)
             
-            # Try to detect loading indicators
+            # Try to detect loading indicators; a transient driver error must not discard the scroll so far
             try:
                 loading_elements = self.driver.find_elements(By.CSS_SELECTOR, "[role='progressbar'], [aria-label*='Loading']")
                 if loading_elements:
                     st.info("Detected Facebook loading indicator, waiting longer...")
                     time.sleep(5)
-            except:
-                pass
+            except WebDriverException as e:
+                st.warning(f"Could not check for Facebook loading indicator: {e}")
             
             # Update progress
             progress_bar.progress((attempt + 1) / scroll_attempts)
@@ -723,11 +1125,10 @@ class FacebookMarketplaceScraper:
         try:
             st.info("Extracting detailed data from Facebook listings...")
             
-            # Find all marketplace listing links
-            marketplace_links = self.driver.find_elements(By.CSS_SELECTOR, "a[href*='/marketplace/item/']")
+            # Read all marketplace listing links in one round-trip
+            marketplace_links = self.driver.execute_script(FB_LISTINGS_JS, "a[href*='/marketplace/item/']")
             
             listings = []
-            seen_urls = set()  # For duplicate detection
             
             # Create progress bar
             progress_bar = st.progress(0)
@@ -737,81 +1138,21 @@ class FacebookMarketplaceScraper:
                 try:
                     status_text.text(f"Processing Facebook listing {i+1}/{len(marketplace_links)}")
                     
-                    # Extract URL
-                    url = link.get_attribute('href')
-                    
-                    # Skip duplicates
-                    if url in seen_urls:
-                        continue
-                    seen_urls.add(url)
+                    # Links arrive already deduplicated by URL
+                    url = link['href']
                     
+                    # Title comes from the image alt text; price, mileage and location from the
+                    # first matching line of the link's text
+                    lines = [line.strip() for line in link['text'].splitlines()]
                     listing_data = {
                         'url': url,
-                        'title': 'N/A',
-                        'price': 'N/A',
-                        'mileage': 'N/A',
-                        'location': 'N/A'
+                        'title': link['alt'].strip() or 'N/A',
+                        'price': next((line for line in lines if PRICE_RE.match(line)), 'N/A'),
+                        'mileage': next((line for line in lines if MILEAGE_RE.match(line)), 'N/A'),
+                        'location': next((line for line in lines
+                                          if LOCATION_RE.match(line) and not MILEAGE_RE.match(line)), 'N/A')
                     }
                     
-                    # Extract price
-                    try:
-                        # Strategy 1: Look for spans with dir="auto" and Facebook's price classes containing $
-                        price_elements = link.find_elements(By.XPATH, ".//span[@dir='auto' and contains(@class, 'x193iq5w') and contains(text(), '$')]")
-                        
-                        # Strategy 2: Any span with dir="auto" containing $
-                        if not price_elements:
-                            price_elements = link.find_elements(By.XPATH, ".//span[@dir='auto'][contains(text(), '$')]")
-                        
-                        # Strategy 3: Any element containing $ symbol
-                        if not price_elements:
-                            price_elements = link.find_elements(By.XPATH, ".//*[contains(text(), '$')]")
-                        
-                        for price_elem in price_elements:
-                            price_text = price_elem.text.strip()
-                            # Check if this looks like a price
-                            if '$' in price_text and len(price_text) < 30 and len(price_text) > 1:
-                                # Must start with $ and contain digits
-                                if price_text.startswith('$') and any(char.isdigit() for char in price_text):
-                                    listing_data['price'] = price_text
-                                    break
-                                    
-                    except Exception as e:
-                        if i < 5:  # Only show first few errors
-                            st.warning(f"Price extraction error for Facebook listing {i+1}: {e}")
-                        pass
-                    
-                    # Extract title from image alt text
-                    try:
-                        img_elements = link.find_elements(By.TAG_NAME, "img")
-                        if img_elements and img_elements[0].get_attribute('alt'):
-                            listing_data['title'] = img_elements[0].get_attribute('alt').strip()
-                    except:
-                        pass
-                    
-                    # Extract location and mileage
-                    try:
-                        # Look for location patterns
-                        text_elements = link.find_elements(By.XPATH, ".//*[contains(text(), ', ') and (contains(text(), 'OR') or contains(text(), 'WA') or contains(text(), 'CA') or contains(text(), 'ID') or contains(text(), 'NV'))]")
-                        for elem in text_elements:
-                            text = elem.text.strip()
-                            if ', ' in text and len(text) < 50:
-                                if 'mile' in text.lower() or 'k mile' in text.lower():
-                                    listing_data['mileage'] = text
-                                else:
-                                    listing_data['location'] = text
-                                break
-                        
-                        # Separate search for mileage if not found above
-                        if listing_data['mileage'] == 'N/A':
-                            mileage_elements = link.find_elements(By.XPATH, ".//*[contains(text(), 'mile') or contains(text(), 'Mile') or contains(text(), 'K mile')]")
-                            for elem in mileage_elements:
-                                mileage_text = elem.text.strip()
-                                if 'mile' in mileage_text.lower() and len(mileage_text) < 30:
-                                    listing_data['mileage'] = mileage_text
-                                    break
-                    except:
-                        pass
-                    
                     listings.append(listing_data)
                     
                     # Update progress
@@ -832,12 +1173,12 @@ class FacebookMarketplaceScraper:
         """Main function to scrape Facebook Marketplace listings"""
         try:
             # Check if session exists
-            session_exists = os.path.exists(self.session_file)
+            session_exists = session_file_exists(self.session_file)
             headless_success = False
             
             if session_exists:
                 st.info("Saved Facebook session found! Trying headless mode...")
-                if self.setup_facebook_driver(headless=True):
+                if self.open_headless_driver():
                     # Try to load saved session
                     st.info("Loading saved Facebook session in headless mode...")
                     session_loaded = self.load_session()
@@ -846,7 +1187,7 @@ class FacebookMarketplaceScraper:
                         # Test if session works by navigating to marketplace
                         st.info("Testing headless access to Facebook marketplace...")
                         self.driver.get(marketplace_url)
-                        time.sleep(10)  # Wait for page load
+                        self.wait_for_listings(timeout=15)
                         
                         # Check if we can find listings
                         test_count = self.get_listing_count()
@@ -859,9 +1200,8 @@ class FacebookMarketplaceScraper:
                         st.warning("Facebook session loading failed, switching to visible mode")
                         
                 # Close headless driver if it failed
-                if not headless_success and self.driver:
-                    self.driver.quit()
-                    self.driver = None
+                if not headless_success:
+                    self.close_driver()
             
             # If headless failed or no session, use visible mode
             if not headless_success:
@@ -917,7 +1257,7 @@ class FacebookMarketplaceScraper:
             
             # Wait for marketplace page to load
             st.info("Waiting for Facebook marketplace page to load...")
-            time.sleep(15)
+            self.wait_for_listings(timeout=15)
             
             # Get initial count
             initial_count = self.get_listing_count()
@@ -925,8 +1265,7 @@ class FacebookMarketplaceScraper:
             
             if initial_count == 0:
                 st.warning("No Facebook listings found initially. Waiting and trying again...")
-                time.sleep(15)
-                initial_count = self.get_listing_count()
+                initial_count = self.poll_listing_count(timeout=15)
                 st.info(f"Facebook second attempt: {initial_count} listings found")
                 
                 if initial_count == 0:
@@ -965,7 +1304,8 @@ def main():
     # App header
     st.title("🚛 Unified Truck Listing Scraper")
     # Check if running on cloud environment
-    is_cloud = hasattr(st, 'secrets') or not os.path.exists('chromedriver')
+    paths = _check_paths()
+    is_cloud = hasattr(st, 'secrets') or not paths["chromedriver"]
     
     if is_cloud:
         st.markdown("Extract truck listings from **Craigslist** - Create Google Sheets automatically!")
@@ -988,7 +1328,7 @@ def main():
     if hasattr(st, 'secrets') and 'google_service_account' in st.secrets:
         st.sidebar.success("✅ Google Sheets (Streamlit secrets)")
         google_auth_available = True
-    elif os.path.exists("service_account.json"):
+    elif paths["service_account"]:
         st.sidebar.success("✅ Google Sheets (local file)")
         google_auth_available = True
     else:
@@ -996,7 +1336,7 @@ def main():
         requirements_met = False
     
     # ChromeDriver check (for local development)
-    if os.path.exists("chromedriver"):
+    if paths["chromedriver"]:
         st.sidebar.success("✅ ChromeDriver found")
     else:
         st.sidebar.warning("⚠️ ChromeDriver not found (may be provided by cloud environment)")
@@ -1004,6 +1344,11 @@ def main():
     if not google_auth_available:
         st.sidebar.error("Please set up Google Sheets authentication!")
     
+    # Recover from a crashed or stuck browser without restarting the app
+    if st.sidebar.button("🔄 Reset scraper", help="Close the shared Chrome browser and start a new one on the next run"):
+        reset_scrapers()
+        st.sidebar.success("Scraper reset")
+    
     # Craigslist Tab
     with tab1:
         st.header("🔧 Craigslist Scraper")
@@ -1051,24 +1396,24 @@ def main():
                 else:
                     # Start Craigslist scraping
                     with st.spinner("Initializing Craigslist scraper..."):
-                        scraper = CraigslistScraper()
+                        scraper = get_scraper('cl_scraper', CraigslistScraper, get_or_create_driver())
                     
                     st.info("🕐 This process may take several minutes depending on the number of listings...")
                     
                     # Run the scraping
-                    listings = scraper.scrape_craigslist(craigslist_url, max_listings)
+                    # Run a pool of browsers only with a local ChromeDriver; cloud hosts (where
+                    # st.secrets always exists, so is_cloud is always set) stay in one browser
+                    workers = CRAIGSLIST_WORKERS if paths["chromedriver"] else 1
+                    listings = scraper.scrape_craigslist(craigslist_url, max_listings, workers)
                     
                     if listings:
                         st.success(f"✅ Successfully scraped {len(listings)} Craigslist listings!")
                         
                         # Create Google Sheet directly from data
                         with st.spinner("Creating Google Sheet..."):
-                            # Convert listings to DataFrame
-                            df = pd.DataFrame(listings)
-                            
                             sheets_manager = GoogleSheetsManager()
-                            sheet_url, sheet_id = sheets_manager.create_sheet_from_dataframe(
-                                df, 
+                            sheet_url, sheet_id = sheets_manager.create_sheet_from_records(
+                                listings, 
                                 craigslist_sheet_name
                             )
                             
@@ -1088,12 +1433,13 @@ def main():
                                 col1, col2, col3, col4 = st.columns(4)
                                 with col1:
                                     st.metric("Total Listings", len(listings))
+                                counts = count_filled(listings, ('price', 'location', 'vin'))
                                 with col2:
-                                    st.metric("With Prices", len([l for l in listings if l['price']]))
+                                    st.metric("With Prices", counts['price'])
                                 with col3:
-                                    st.metric("With Locations", len([l for l in listings if l['location']]))
+                                    st.metric("With Locations", counts['location'])
                                 with col4:
-                                    st.metric("With VINs", len([l for l in listings if l['vin']]))
+                                    st.metric("With VINs", counts['vin'])
                                 
                             else:
                                 st.error("❌ Failed to create Google Sheet")
@@ -1104,7 +1450,7 @@ def main():
             st.markdown("### 📊 Requirements Status")
             
             # Check requirements
-            if os.path.exists("chromedriver"):
+            if paths["chromedriver"]:
                 st.success("✅ ChromeDriver found")
             else:
                 st.warning("⚠️ ChromeDriver not in local directory")
@@ -1112,7 +1458,7 @@ def main():
             
             if hasattr(st, 'secrets') and 'google_service_account' in st.secrets:
                 st.success("✅ Google Sheets (Cloud secrets)")
-            elif os.path.exists("service_account.json"):
+            elif paths["service_account"]:
                 st.success("✅ Google Sheets (Local file)")
             else:
                 st.error("❌ Google Sheets authentication missing")
@@ -1154,8 +1500,7 @@ def main():
             )
             
             # Check session status
-            session_file = "facebook_session.pkl"
-            if os.path.exists(session_file):
+            if paths["fb_session"]:
                 st.success("✅ Saved Facebook session found - may be able to run in headless mode")
             else:
                 st.info("ℹ️ No saved session - manual login will be required")
@@ -1168,7 +1513,10 @@ def main():
                 else:
                     # Start Facebook scraping
                     with st.spinner("Initializing Facebook scraper..."):
-                        scraper = FacebookMarketplaceScraper()
+                        # A saved session runs headless in a tab of the shared browser; without one
+                        # the login needs its own visible browser, so don't start the shared one
+                        shared_driver = get_or_create_driver() if paths["fb_session"] else None
+                        scraper = get_scraper('fb_scraper', FacebookMarketplaceScraper, shared_driver)
                     
                     st.info("🕐 This process may take several minutes depending on the number of listings...")
                     
@@ -1180,12 +1528,9 @@ def main():
                         
                         # Create Google Sheet directly from data
                         with st.spinner("Creating Google Sheet..."):
-                            # Convert listings to DataFrame
-                            df = pd.DataFrame(listings)
-                            
                             sheets_manager = GoogleSheetsManager()
-                            sheet_url, sheet_id = sheets_manager.create_sheet_from_dataframe(
-                                df, 
+                            sheet_url, sheet_id = sheets_manager.create_sheet_from_records(
+                                listings, 
                                 facebook_sheet_name
                             )
                             
@@ -1205,28 +1550,27 @@ def main():
                                 col1, col2, col3, col4 = st.columns(4)
                                 with col1:
                                     st.metric("Total Listings", len(listings))
+                                counts = count_filled(listings, ('price', 'location', 'mileage'))
                                 with col2:
-                                    st.metric("With Prices", len([l for l in listings if l['price'] != 'N/A']))
+                                    st.metric("With Prices", counts['price'])
                                 with col3:
-                                    st.metric("With Locations", len([l for l in listings if l['location'] != 'N/A']))
+                                    st.metric("With Locations", counts['location'])
                                 with col4:
-                                    st.metric("With Mileage", len([l for l in listings if l['mileage'] != 'N/A']))
+                                    st.metric("With Mileage", counts['mileage'])
                                 
                             else:
                                 st.error("❌ Failed to create Google Sheet")
                     else:
                         st.error("❌ No Facebook listings were successfully scraped")
                         
-                    # Clean up driver if it exists
-                    if hasattr(scraper, 'driver') and scraper.driver:
-                        scraper.driver.quit()
+                    # Clean up driver (or shared-browser tab) if it exists
+                    scraper.close_driver()
         
         with col2:
             st.markdown("### 📊 Facebook Status")
             
             # Check Facebook session status
-            session_file = "facebook_session.pkl"
-            if os.path.exists(session_file):
+            if paths["fb_session"]:
                 st.success("✅ Facebook session found")
                 st.info("May run in headless mode")
             else:
@@ -1234,7 +1578,7 @@ def main():
                 st.warning("Manual login required")
             
             # Check requirements for Facebook
-            if os.path.exists("chromedriver"):
+            if paths["chromedriver"]:
                 st.success("✅ ChromeDriver ready")
             else:
                 st.warning("⚠️ ChromeDriver not in local directory")
@@ -1242,7 +1586,7 @@ def main():
             
             if hasattr(st, 'secrets') and 'google_service_account' in st.secrets:
                 st.success("✅ Google Sheets (Cloud secrets)")
-            elif os.path.exists("service_account.json"):
+            elif paths["service_account"]:
                 st.success("✅ Google Sheets (Local file)")
             else:
                 st.error("❌ Google Sheets authentication missing")
@@ -1326,7 +1670,7 @@ def main():
         with col2:
             st.markdown("**Scraping**\n- Selenium\n- ChromeDriver")
         with col3:
-            st.markdown("**Data**\n- Google Sheets API\n- Pandas")
+            st.markdown("**Data**\n- Google Sheets API\n- gspread")
 
 
 if __name__ == "__main__":